@@ -0,0 +1,115 @@
+"""
+CUDA Monte Carlo kernel for large simulations.
+
+Pricing paths are independent, so the GPU runs one antithetic pair per
+thread iteration (grid-stride loop) with cuRAND-style xoroshiro128+
+normals. Path arithmetic is FP32, which doubles throughput on most GPUs;
+at the sizes this is used for, the Monte Carlo standard error is orders
+of magnitude larger than FP32 rounding. Per-thread sums are FP64 and are
+merged on the host like the CPU kernels' chunks.
+
+Only used when Numba can see a CUDA device (see price_european_option).
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+from numba import cuda, float32, float64
+from numba.cuda.random import (
+    create_xoroshiro128p_states,
+    xoroshiro128p_normal_float32,
+)
+
+from app._kernels import _estimate, _merge_chunks, _simulated_is_call
+
+THREADS_PER_BLOCK = 256
+BLOCKS = 256
+
+
+@lru_cache(maxsize=1)
+def cuda_available() -> bool:
+    """Whether a usable CUDA device is present (checked once)."""
+    return cuda.is_available()
+
+
+@cuda.jit(device=True)
+def _payoff(terminal_price, K, is_call):
+    if is_call:
+        return max(terminal_price - K, float32(0.0))
+    return max(K - terminal_price, float32(0.0))
+
+
+@cuda.jit(fastmath=True)
+def _mc_cuda_kernel(rng_states, S, K, drift, sigma_sqrt_t, is_call, n_pairs, out):
+    """
+    Write each thread's shifted sums of pair payoffs x and controls c to
+    its row of out, in app._kernels._merge_chunks layout:
+    [count, x0, c0, sum x, sum c, sum x², sum c², sum xc].
+    """
+    tid = cuda.grid(1)
+    stride = cuda.gridsize(1)
+    half = float32(0.5)
+
+    count = 0.0
+    x0 = 0.0
+    c0 = 0.0
+    sx = 0.0
+    sc = 0.0
+    sxx = 0.0
+    scc = 0.0
+    sxc = 0.0
+    for _ in range(tid, n_pairs, stride):
+        z = xoroshiro128p_normal_float32(rng_states, tid)
+        up = S * math.exp(drift + sigma_sqrt_t * z)
+        down = S * math.exp(drift - sigma_sqrt_t * z)
+        # FP32 path math (a bare 0.5 would widen it to FP64), FP64 sums
+        x = float64(half * (_payoff(up, K, is_call) + _payoff(down, K, is_call)))
+        c = float64(half * (up + down))
+        if count == 0.0:
+            x0 = x
+            c0 = c
+        x -= x0
+        c -= c0
+        count += 1.0
+        sx += x
+        sc += c
+        sxx += x * x
+        scc += c * c
+        sxc += x * c
+
+    out[tid, 0] = count
+    out[tid, 1] = x0
+    out[tid, 2] = c0
+    out[tid, 3] = sx
+    out[tid, 4] = sc
+    out[tid, 5] = sxx
+    out[tid, 6] = scc
+    out[tid, 7] = sxc
+
+
+def mc_cuda(S, K, T, sigma, r, is_call, n, seeds):
+    """
+    GPU counterpart of app._kernels._mc_kernel (same arguments and
+    antithetic/control variate estimator).
+
+    Returns:
+        (mean, estimator variance) of the undiscounted payoff
+    """
+    n_pairs = (n + 1) // 2
+    n_threads = THREADS_PER_BLOCK * BLOCKS
+
+    rng_states = create_xoroshiro128p_states(n_threads, seed=int(seeds[0]))
+    out = cuda.device_array((n_threads, 8))
+    _mc_cuda_kernel[BLOCKS, THREADS_PER_BLOCK](
+        rng_states,
+        np.float32(S),
+        np.float32(K),
+        np.float32((r - 0.5 * sigma * sigma) * T),
+        np.float32(sigma * math.sqrt(T)),
+        _simulated_is_call(T, sigma, is_call),
+        n_pairs,
+        out,
+    )
+    # One chunk per thread
+    return _estimate(_merge_chunks(out.copy_to_host()), S, K, T, sigma, r, is_call)
@@ -0,0 +1,379 @@
+"""
+Numba-compiled Monte Carlo kernels.
+
+The NumPy version of the GBM simulation materialized several arrays of
+length num_simulations (normals, terminal prices, payoffs, discounted
+payoffs) and swept them again for the mean and standard deviation.
+These kernels fuse draw -> terminal price -> payoff -> reduction into a
+single parallel loop that only keeps scalar accumulators.
+
+Two variance reduction techniques are applied on the fly:
+- Antithetic variates: each normal Z is used as both +Z and -Z, and the
+  pair's average payoff is one observation.
+- Control variate: the terminal price S_T, whose risk-neutral mean
+  S_0*e^(rT) is known, corrects the payoff mean with the sample-optimal
+  coefficient β = Cov(payoff, S_T) / Var(S_T). Above CV_MAX_SIGMA_SQRT_T
+  the control is replaced by put-call parity (see _estimate).
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+# Paths are split into a fixed number of chunks, each seeded on its own
+# (seeds[c], see monte_carlo._chunk_seeds), so a given seed yields the
+# same result regardless of the thread count.
+N_CHUNKS = 64
+
+# Above this σ√T, S_T is too heavy-tailed for an estimated control
+# variate: its sample mean typically falls well short of the forward, and
+# β·(mean S_T - forward) carries that error into the price. By then the
+# optimal β has converged to 0 for puts and 1 for calls, so puts are priced
+# without the control and calls from the put by parity,
+# C = P + S_0 - K*e^(-rT), which is the β = 1 control; both payoffs are
+# bounded by K.
+CV_MAX_SIGMA_SQRT_T = 1.5
+
+
+@njit(fastmath=True, cache=True)
+def _antithetic_pair(S, K, drift, sigma_sqrt_t, z, is_call):
+    """
+    Average payoff x and control value c of the (+z, -z) path pair.
+
+    Path arithmetic is FP32 (float32 arguments): at these sample sizes the
+    Monte Carlo error is orders of magnitude above FP32 rounding, and the
+    narrower type halves the cost of exp. Results are widened to FP64 so
+    the reductions stay accurate.
+    """
+    zero = np.float32(0.0)
+    half = np.float32(0.5)
+    up = S * math.exp(drift + sigma_sqrt_t * z)
+    down = S * math.exp(drift - sigma_sqrt_t * z)
+    if is_call:
+        x = half * (max(up - K, zero) + max(down - K, zero))
+    else:
+        x = half * (max(K - up, zero) + max(K - down, zero))
+    return np.float64(x), np.float64(half * (up + down))
+
+
+@njit(fastmath=True, cache=True)
+def _path_constants(S, K, T, sigma, r):
+    """FP32 spot, strike, drift and σ√T for _antithetic_pair."""
+    return (
+        np.float32(S),
+        np.float32(K),
+        np.float32((r - 0.5 * sigma * sigma) * T),
+        np.float32(sigma * math.sqrt(T)),
+    )
+
+
+@njit(fastmath=True, cache=True)
+def _merge_chunks(partials):
+    """
+    Merge per-chunk shifted sums into co-moments
+    [count, mean_x, mean_c, M2_x, M2_c, C_xc] (Chan et al. parallel update).
+
+    Each row of partials is [count, x0, c0, sum x, sum c, sum x², sum c²,
+    sum xc], the sums taken over x - x0 and c - c0 where (x0, c0) is the
+    chunk's first pair. A sample of the chunk itself stays close to the
+    chunk's mean on the scale of its spread, so sum(x²) - sum(x)²/n does
+    not cancel even where the sample mean of S_T is far from the forward
+    (large σ√T), and the hot loop needs no division.
+    """
+    moments = np.zeros(6)
+    for k in range(partials.shape[0]):
+        n_b = partials[k, 0]
+        if n_b == 0.0:
+            continue
+        sx = partials[k, 3]
+        sc = partials[k, 4]
+        n = moments[0] + n_b
+        dx = partials[k, 1] + sx / n_b - moments[1]
+        dc = partials[k, 2] + sc / n_b - moments[2]
+        weight = moments[0] * n_b / n
+        moments[0] = n
+        moments[1] += dx * n_b / n
+        moments[2] += dc * n_b / n
+        moments[3] += partials[k, 5] - sx * sx / n_b + dx * dx * weight
+        moments[4] += partials[k, 6] - sc * sc / n_b + dc * dc * weight
+        moments[5] += partials[k, 7] - sx * sc / n_b + dx * dc * weight
+    return moments
+
+
+@njit(fastmath=True, cache=True)
+def _simulated_is_call(T, sigma, is_call):
+    """Whether paths are simulated with the call payoff (see _estimate)."""
+    return is_call and sigma * math.sqrt(T) <= CV_MAX_SIGMA_SQRT_T
+
+
+@njit(fastmath=True, cache=True)
+def _control_beta(moments, T, sigma):
+    """
+    Sample-optimal control coefficient β = C_xc / M2_c for co-moments from
+    _merge_chunks, or 0 above CV_MAX_SIGMA_SQRT_T.
+    """
+    if sigma * math.sqrt(T) > CV_MAX_SIGMA_SQRT_T or moments[4] <= 0.0:
+        return 0.0
+    return moments[5] / moments[4]
+
+
+@njit(fastmath=True, cache=True)
+def _controlled_mean(moments, beta, S, K, T, sigma, r, is_call):
+    """
+    Undiscounted payoff mean from co-moments of paths simulated with the
+    payoff selected by _simulated_is_call, corrected by the control with
+    coefficient beta.
+    """
+    forward = S * math.exp(r * T)
+    mean = moments[1] - beta * (moments[2] - forward)
+    if is_call and not _simulated_is_call(T, sigma, is_call):
+        mean += forward - K  # put-call parity
+    return mean
+
+
+@njit(fastmath=True, cache=True)
+def _estimate(moments, S, K, T, sigma, r, is_call):
+    """
+    Apply the control variate (or parity) to co-moments from _merge_chunks.
+
+    Returns:
+        (mean, estimator variance) of the undiscounted payoff
+    """
+    count = moments[0]
+    beta = _control_beta(moments, T, sigma)
+    mean = _controlled_mean(moments, beta, S, K, T, sigma, r, is_call)
+    # Unbiased residual variance; clamp rounding noise (e.g. all-zero payoffs)
+    variance = max((moments[3] - beta * moments[5]) / max(count - 1.0, 1.0), 0.0)
+    return mean, variance / count
+
+
+# nogil lets callers run the kernel in a worker thread (asyncio.to_thread)
+# without holding the GIL for the whole simulation. Launches must still be
+# serialized (see monte_carlo._kernel_lock): the workqueue threading layer
+# is not safe for concurrent parallel regions.
+#
+# The kernels declare their signature, so each is compiled (or loaded from
+# the cache) for exactly these types when the module is imported, and a
+# call never triggers type inference or a new specialization. Arguments of
+# other types raise TypeError instead of compiling; changing a signature
+# means a recompile (the cache is keyed on it).
+@njit(
+    "Tuple((f8, f8))(f8, f8, f8, f8, f8, b1, i8, u4[::1])",
+    parallel=True,
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _mc_kernel(S, K, T, sigma, r, is_call, n, seeds):
+    """
+    Simulate n terminal prices under GBM (n/2 antithetic pairs) and
+    reduce their payoffs.
+
+    Returns:
+        (mean, estimator variance) of the undiscounted payoff
+    """
+    S32, K32, drift, sigma_sqrt_t = _path_constants(S, K, T, sigma, r)
+    path_is_call = _simulated_is_call(T, sigma, is_call)
+    n_pairs = (n + 1) // 2
+    chunk_size = (n_pairs + N_CHUNKS - 1) // N_CHUNKS
+
+    partials = np.zeros((N_CHUNKS, 8))
+
+    for c in prange(N_CHUNKS):
+        np.random.seed(seeds[c])
+
+        start = c * chunk_size
+        stop = min(start + chunk_size, n_pairs)
+
+        x0 = 0.0
+        c0 = 0.0
+        sx = 0.0
+        sc = 0.0
+        sxx = 0.0
+        scc = 0.0
+        sxc = 0.0
+        for j in range(start, stop):
+            z = np.float32(np.random.standard_normal())
+            x, cv = _antithetic_pair(S32, K32, drift, sigma_sqrt_t, z, path_is_call)
+            if j == start:
+                x0 = x
+                c0 = cv
+            x -= x0
+            cv -= c0
+            sx += x
+            sc += cv
+            sxx += x * x
+            scc += cv * cv
+            sxc += x * cv
+
+        partials[c, 0] = max(stop - start, 0)
+        partials[c, 1] = x0
+        partials[c, 2] = c0
+        partials[c, 3] = sx
+        partials[c, 4] = sc
+        partials[c, 5] = sxx
+        partials[c, 6] = scc
+        partials[c, 7] = sxc
+
+    return _estimate(_merge_chunks(partials), S, K, T, sigma, r, is_call)
+
+
+@njit(
+    "f8[::1](f4[:, ::1], f8, f8, f8, f8, f8, b1)",
+    parallel=True,
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _mc_normals_kernel(Z, S, K, T, sigma, r, is_call):
+    """
+    Apply the antithetic/control-variate estimator to each row of
+    pre-drawn normals (e.g. independently scrambled Sobol replicates).
+
+    β is estimated once from all rows pooled. Its O(1/n) bias is the same
+    in every row, so with a β per row averaging the rows would keep the
+    bias while the spread of the row means (the reported error) shrinks.
+
+    Returns:
+        array of per-row undiscounted mean payoffs
+    """
+    n_rows, n_pairs = Z.shape
+    S32, K32, drift, sigma_sqrt_t = _path_constants(S, K, T, sigma, r)
+    path_is_call = _simulated_is_call(T, sigma, is_call)
+
+    # Each row is a single chunk (see _merge_chunks)
+    partials = np.zeros((n_rows, 8))
+
+    for row in prange(n_rows):
+        sums = partials[row]
+        for j in range(n_pairs):
+            x, cv = _antithetic_pair(
+                S32, K32, drift, sigma_sqrt_t, np.float32(Z[row, j]), path_is_call
+            )
+            if j == 0:
+                sums[1] = x
+                sums[2] = cv
+            x -= sums[1]
+            cv -= sums[2]
+            sums[3] += x
+            sums[4] += cv
+            sums[5] += x * x
+            sums[6] += cv * cv
+            sums[7] += x * cv
+        sums[0] = n_pairs
+
+    beta = _control_beta(_merge_chunks(partials), T, sigma)
+    means = np.empty(n_rows)
+    for row in range(n_rows):
+        means[row] = _controlled_mean(
+            _merge_chunks(partials[row : row + 1]), beta, S, K, T, sigma, r, is_call
+        )
+
+    return means
+
+
+@njit(
+    "Tuple((f8[::1], f8[::1]))"
+    "(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], b1[::1], i8[::1], u4[::1])",
+    parallel=True,
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _mc_batch_kernel(S, K, T, sigma, r, is_call, n, seeds):
+    """
+    Price a book of options (one array entry per option) on shared draws.
+
+    Pair j's normal is reused by every option with j < n[i]/2, so the RNG
+    cost is paid once for the whole batch instead of once per option.
+
+    Returns:
+        (means, estimator variances) arrays of the undiscounted payoffs
+    """
+    m = S.shape[0]
+    S32 = S.astype(np.float32)
+    K32 = K.astype(np.float32)
+    drift = ((r - 0.5 * sigma * sigma) * T).astype(np.float32)
+    sigma_sqrt_t = (sigma * np.sqrt(T)).astype(np.float32)
+    path_is_call = np.empty(m, dtype=np.bool_)
+    for i in range(m):
+        path_is_call[i] = _simulated_is_call(T[i], sigma[i], is_call[i])
+    n_pairs = (n + 1) // 2
+    max_pairs = n_pairs.max()
+    chunk_size = (max_pairs + N_CHUNKS - 1) // N_CHUNKS
+
+    partials = np.zeros((N_CHUNKS, m, 8))
+
+    for c in prange(N_CHUNKS):
+        np.random.seed(seeds[c])
+
+        start = c * chunk_size
+        stop = min(start + chunk_size, max_pairs)
+
+        for j in range(start, stop):
+            z = np.float32(np.random.standard_normal())
+            for i in range(m):
+                if j >= n_pairs[i]:
+                    continue
+                x, cv = _antithetic_pair(
+                    S32[i], K32[i], drift[i], sigma_sqrt_t[i], z, path_is_call[i]
+                )
+                sums = partials[c, i]
+                if j == start:
+                    sums[1] = x
+                    sums[2] = cv
+                x -= sums[1]
+                cv -= sums[2]
+                sums[0] += 1.0
+                sums[3] += x
+                sums[4] += cv
+                sums[5] += x * x
+                sums[6] += cv * cv
+                sums[7] += x * cv
+
+    means = np.empty(m)
+    variances = np.empty(m)
+    for i in range(m):
+        means[i], variances[i] = _estimate(
+            _merge_chunks(partials[:, i, :]),
+            S[i],
+            K[i],
+            T[i],
+            sigma[i],
+            r[i],
+            is_call[i],
+        )
+    return means, variances
+
+
+def warmup() -> None:
+    """
+    Launch every kernel once on tiny inputs.
+
+    The kernels are compiled (or loaded from Numba's on-disk cache) when
+    this module is imported; the first launch also starts the threading
+    layer's worker pool. Running the import during the Docker build writes
+    the cache into the image.
+    """
+    seeds = np.zeros(N_CHUNKS, dtype=np.uint32)
+    _mc_kernel(100.0, 100.0, 1.0, 0.2, 0.05, True, 1_000, seeds)
+    _mc_normals_kernel(
+        np.zeros((2, 8), dtype=np.float32), 100.0, 100.0, 1.0, 0.2, 0.05, True
+    )
+    _mc_batch_kernel(
+        np.full(2, 100.0),
+        np.full(2, 100.0),
+        np.ones(2),
+        np.full(2, 0.2),
+        np.full(2, 0.05),
+        np.array([True, False]),
+        np.full(2, 1_000, dtype=np.int64),
+        seeds,
+    )
+
+
+# Warm up at import, i.e. on the importing (main) thread: with the TBB
+# threading layer, a first parallel launch from a worker thread such as
+# asyncio.to_thread hangs interpreter exit.
+warmup()
@@ -7,22 +7,51 @@ This provides:
 - Much faster computation for simple cases
 """
 
-import numpy as np
-from scipy.stats import norm
+from math import copysign, erf, exp, inf, log, nan, pi, sqrt
 from typing import Literal
 
+# The inputs here are scalars, so plain math-module formulas avoid the
+# per-call dispatch overhead of scipy.stats.norm.
+_INV_SQRT_2 = 1.0 / sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / sqrt(2.0 * pi)
 
-def black_scholes_price(
+
+def _Phi(x: float) -> float:
+    """Standard normal CDF."""
+    return 0.5 * (1.0 + erf(x * _INV_SQRT_2))
+
+
+def _phi(x: float) -> float:
+    """Standard normal PDF."""
+    return _INV_SQRT_2PI * exp(-0.5 * x * x)
+
+
+def _div(numerator: float, denominator: float) -> float:
+    """
+    Divide with IEEE semantics for a zero denominator.
+
+    Zero volatility is a valid input, so d1 must degrade to ±inf (and
+    gamma to nan) rather than raise ZeroDivisionError.
+    """
+    if denominator:
+        return numerator / denominator
+    return copysign(inf, numerator) if numerator else nan
+
+
+def price_and_greeks(
     spot_price: float,
     strike_price: float,
     time_to_maturity: float,
     volatility: float,
     risk_free_rate: float,
     option_type: Literal["call", "put"],
-) -> float:
+) -> tuple[float, dict[str, float]]:
     """
-    Calculate European option price using Black-Scholes formula.
-    
+    Calculate the Black-Scholes price and Greeks in a single pass.
+
+    d1, d2, √T, e^(-rT), N(±d1), N(±d2) and φ(d1) are evaluated once and
+    shared between the price and every Greek.
+
     Formula:
     - Call: S*N(d1) - K*e^(-rT)*N(d2)
     - Put: K*e^(-rT)*N(-d2) - S*N(-d1)
@@ -30,26 +59,87 @@ def black_scholes_price(
     Where:
     - d1 = [ln(S/K) + (r + σ²/2)T] / (σ√T)
     - d2 = d1 - σ√T
+
+    Returns:
+        (price, greeks) where greeks has delta, gamma, vega, theta, rho
     """
+    sqrt_t = sqrt(time_to_maturity)
+    sigma_sqrt_t = volatility * sqrt_t
+    discount_factor = exp(-risk_free_rate * time_to_maturity)
+
     # Calculate d1 and d2
-    d1 = (
-        np.log(spot_price / strike_price)
-        + (risk_free_rate + 0.5 * volatility**2) * time_to_maturity
-    ) / (volatility * np.sqrt(time_to_maturity))
-    
-    d2 = d1 - volatility * np.sqrt(time_to_maturity)
+    d1 = _div(
+        log(spot_price / strike_price)
+        + (risk_free_rate + 0.5 * volatility**2) * time_to_maturity,
+        sigma_sqrt_t,
+    )
     
-    # Calculate price based on option type
+    d2 = d1 - sigma_sqrt_t
+
+    # Shared subexpressions: φ(d1) feeds gamma, vega and theta; the
+    # discounted strike term K*e^(-rT)*N(±d2) feeds price, theta and rho
+    pdf_d1 = _phi(d1)
+    spot_pdf_d1 = spot_price * pdf_d1
+    discounted_strike = strike_price * discount_factor
+
+    # Price, delta, and the type-dependent parts of theta and rho
     if option_type == "call":
-        price = spot_price * norm.cdf(d1) - strike_price * np.exp(
-            -risk_free_rate * time_to_maturity
-        ) * norm.cdf(d2)
+        cdf_d1 = _Phi(d1)
+        strike_term = discounted_strike * _Phi(d2)
+        price = spot_price * cdf_d1 - strike_term
+        delta = cdf_d1
+        theta_rate = -risk_free_rate * strike_term
+        rho = time_to_maturity * strike_term / 100
     else:  # put
-        price = strike_price * np.exp(
-            -risk_free_rate * time_to_maturity
-        ) * norm.cdf(-d2) - spot_price * norm.cdf(-d1)
-    
-    return float(price)
+        cdf_d1 = _Phi(-d1)
+        strike_term = discounted_strike * _Phi(-d2)
+        price = strike_term - spot_price * cdf_d1
+        delta = -cdf_d1
+        theta_rate = risk_free_rate * strike_term
+        rho = -time_to_maturity * strike_term / 100
+
+    # Gamma (same for call and put)
+    gamma = _div(pdf_d1, spot_price * sigma_sqrt_t)
+
+    # Vega (same for call and put, divided by 100 for 1% change)
+    vega = spot_pdf_d1 * sqrt_t / 100
+
+    # Theta (time decay per day)
+    theta = (-(spot_pdf_d1 * volatility) / (2 * sqrt_t) + theta_rate) / 365
+
+    greeks = {
+        "delta": float(delta),
+        "gamma": float(gamma),
+        "vega": float(vega),
+        "theta": float(theta),
+        "rho": float(rho),
+    }
+    return float(price), greeks
+
+
+def black_scholes_price(
+    spot_price: float,
+    strike_price: float,
+    time_to_maturity: float,
+    volatility: float,
+    risk_free_rate: float,
+    option_type: Literal["call", "put"],
+) -> float:
+    """
+    Calculate European option price using Black-Scholes formula.
+
+    See price_and_greeks for the formula; use it directly when the
+    Greeks are needed too.
+    """
+    price, _ = price_and_greeks(
+        spot_price,
+        strike_price,
+        time_to_maturity,
+        volatility,
+        risk_free_rate,
+        option_type,
+    )
+    return price
 
 
 def calculate_greeks(
@@ -70,52 +160,12 @@ def calculate_greeks(
     - Theta: time decay
     - Rho: sensitivity to interest rate
     """
-    # Calculate d1 and d2
-    d1 = (
-        np.log(spot_price / strike_price)
-        + (risk_free_rate + 0.5 * volatility**2) * time_to_maturity
-    ) / (volatility * np.sqrt(time_to_maturity))
-    
-    d2 = d1 - volatility * np.sqrt(time_to_maturity)
-    
-    # Delta
-    if option_type == "call":
-        delta = norm.cdf(d1)
-    else:
-        delta = -norm.cdf(-d1)
-    
-    # Gamma (same for call and put)
-    gamma = norm.pdf(d1) / (spot_price * volatility * np.sqrt(time_to_maturity))
-    
-    # Vega (same for call and put, divided by 100 for 1% change)
-    vega = spot_price * norm.pdf(d1) * np.sqrt(time_to_maturity) / 100
-    
-    # Theta (time decay per day)
-    if option_type == "call":
-        theta = (
-            -(spot_price * norm.pdf(d1) * volatility) / (2 * np.sqrt(time_to_maturity))
-            - risk_free_rate * strike_price * np.exp(-risk_free_rate * time_to_maturity) * norm.cdf(d2)
-        ) / 365
-    else:
-        theta = (
-            -(spot_price * norm.pdf(d1) * volatility) / (2 * np.sqrt(time_to_maturity))
-            + risk_free_rate * strike_price * np.exp(-risk_free_rate * time_to_maturity) * norm.cdf(-d2)
-        ) / 365
-    
-    # Rho (sensitivity to 1% change in interest rate)
-    if option_type == "call":
-        rho = strike_price * time_to_maturity * np.exp(
-            -risk_free_rate * time_to_maturity
-        ) * norm.cdf(d2) / 100
-    else:
-        rho = -strike_price * time_to_maturity * np.exp(
-            -risk_free_rate * time_to_maturity
-        ) * norm.cdf(-d2) / 100
-    
-    return {
-        "delta": float(delta),
-        "gamma": float(gamma),
-        "vega": float(vega),
-        "theta": float(theta),
-        "rho": float(rho),
-    }
\ No newline at end of file
+    _, greeks = price_and_greeks(
+        spot_price,
+        strike_price,
+        time_to_maturity,
+        volatility,
+        risk_free_rate,
+        option_type,
+    )
+    return greeks
@@ -5,7 +5,7 @@ from pathlib import Path
 # Paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
-RESULTS_FILE = DATA_DIR / "results.json"
+RESULTS_FILE = DATA_DIR / "results.ndjson"  # one JSON document per line
 
 # Ensure data directory exists
 DATA_DIR.mkdir(exist_ok=True)
@@ -28,6 +28,20 @@ Built with FastAPI, Pydantic, and NumPy.
 # Simulation defaults
 DEFAULT_SIMULATIONS = 100_000
 MAX_SIMULATIONS = 1_000_000
+MAX_BATCH_SIZE = 100  # options per POST /simulations/batch
+CUDA_MIN_SIMULATIONS = 100_000  # smaller runs stay on the CPU kernel
+# Price with scrambled Sobol QMC on the CPU. At equal path counts its error
+# is far below pseudo-random draws even on a GPU, so the CUDA kernel is
+# only used when this is False.
+USE_QMC = True
+# Options whose Black-Scholes price is below this fraction of max(S, K)
+# are deep out of the money: the simulation is skipped and the analytical
+# price is returned with a zero standard error
+DEEP_OTM_PRICE_THRESHOLD = 1e-10
+DEEP_OTM_WARNING = (
+    "Deep out of the money: the Black-Scholes price is negligible, so the "
+    "Monte Carlo simulation was skipped and the analytical price returned"
+)
 
 # Simulated async delay for "fetching risk-free rate"
 RISK_FREE_RATE_FETCH_DELAY = 0.5  # seconds
\ No newline at end of file
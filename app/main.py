@@ -23,10 +23,15 @@ from app.models import (
     SimulationResult,
     HealthCheckResponse,
 )
-from app.monte_carlo import price_european_option, validate_pricing_inputs
-from app.black_scholes import black_scholes_price, calculate_greeks
+from app.monte_carlo import (
+    price_batch,
+    price_european_option,
+    validate_pricing_inputs,
+)
+from app.black_scholes import price_and_greeks
 from app.persistence import (
     save_simulation_result,
+    save_simulation_results,
     get_simulation_result,
     get_all_simulation_results,
     delete_simulation_result,
@@ -35,6 +40,9 @@ from app.config import (
     APP_NAME,
     APP_VERSION,
     APP_DESCRIPTION,
+    DEEP_OTM_PRICE_THRESHOLD,
+    DEEP_OTM_WARNING,
+    MAX_BATCH_SIZE,
     RISK_FREE_RATE_FETCH_DELAY,
 )
 
@@ -100,6 +108,90 @@ async def validate_inputs_async(request: OptionPricingRequest) -> None:
         )
 
 
+def _pricing_args(
+    request: OptionPricingRequest,
+) -> tuple[float, float, float, float, float, str]:
+    """
+    Read (S, K, T, σ, r, option_type) off the request once; the pricers
+    take them positionally in this order.
+    """
+    return (
+        request.spot_price,
+        request.strike_price,
+        request.time_to_maturity,
+        request.volatility,
+        request.risk_free_rate,
+        request.option_type,
+    )
+
+
+def _is_negligible(bs_price: float, args: tuple) -> bool:
+    """
+    Whether the analytical price is zero to working precision relative to
+    the option's scale (deep out of the money), so Monte Carlo would only
+    average zero payoffs.
+    """
+    spot_price, strike_price = args[0], args[1]
+    return bs_price <= DEEP_OTM_PRICE_THRESHOLD * max(spot_price, strike_price)
+
+
+def _analytical_result(bs_price: float) -> dict:
+    """
+    Stand-in for a Monte Carlo result when the simulation is skipped: the
+    Black-Scholes price is exact, so there is no sampling error.
+    """
+    return {
+        "price": bs_price,
+        "std_error": 0.0,
+        "confidence_interval_95": 0.0,
+        "warning": DEEP_OTM_WARNING,
+    }
+
+
+def _build_simulation(
+    request: OptionPricingRequest,
+    pricing_result: dict,
+    bs_price: float,
+    greeks: dict[str, float],
+) -> tuple[SimulationResult, OptionPricingResponse]:
+    """
+    Combine a Monte Carlo result with the Black-Scholes comparison into
+    the record to save and the API response.
+    """
+    # Step 5: Generate unique ID and timestamp
+    simulation_id = f"sim_{int(time.time())}_{secrets.token_hex(4)}"
+    timestamp = datetime.utcnow()
+
+    # Step 6: Build the record to save
+    # Every field is computed here from already-validated inputs, so
+    # model_construct skips re-validating them
+    result = SimulationResult.model_construct(
+        simulation_id=simulation_id,
+        option_price=pricing_result["price"],
+        std_error=pricing_result["std_error"],
+        confidence_interval_95=pricing_result["confidence_interval_95"],
+        black_scholes_price=bs_price,
+        greeks=greeks,
+        inputs=request.model_dump(),
+        timestamp=timestamp,
+        warning=pricing_result.get("warning"),
+    )
+
+    # Step 7: Build the response
+    response = OptionPricingResponse.model_construct(
+        simulation_id=simulation_id,
+        option_price=pricing_result["price"],
+        std_error=pricing_result["std_error"],
+        confidence_interval_95=pricing_result["confidence_interval_95"],
+        black_scholes_price=bs_price,
+        greeks=greeks,
+        inputs=request,
+        timestamp=timestamp,
+        warning=pricing_result.get("warning"),
+    )
+    return result, response
+
+
 # ==============
 # API ENDPOINTS
 # ==============
@@ -139,77 +231,112 @@ async def create_simulation(request: OptionPricingRequest):
         # Step 1: Validate inputs (async - might involve DB/API calls)
         await validate_inputs_async(request)
 
-        # Step 2: Simulate fetching market data (async I/O)
+        # Step 2: Calculate Black-Scholes price and Greeks for comparison
+        # (microseconds of scalar math, cheaper than a thread hop)
+        args = _pricing_args(request)
+        bs_price, greeks = price_and_greeks(*args)
+
+        # Step 3: Simulate fetching market data (async I/O)
         # In production, this might fetch current spot prices, volatility surface, etc.
-        await fetch_risk_free_rate_async()
-
-        # Step 3: Run the pricing calculation (CPU-bound, so NOT async)
-        # We run this in the default thread pool to avoid blocking
-        # For truly CPU-intensive work, consider running in a process pool
-        pricing_result = price_european_option(
-            spot_price=request.spot_price,
-            strike_price=request.strike_price,
-            time_to_maturity=request.time_to_maturity,
-            volatility=request.volatility,
-            risk_free_rate=request.risk_free_rate,
-            option_type=request.option_type,
-            num_simulations=request.num_simulations,
+        # Step 4: Run the pricing calculation (CPU-bound, so NOT async)
+        # in the default thread pool; the Numba kernel releases the GIL, so
+        # the event loop keeps serving other requests while it runs.
+        # The pricing does not use the fetched data, so both run at once and
+        # the I/O wait overlaps the simulation instead of preceding it.
+        # Deep out-of-the-money options skip the simulation: every path
+        # would pay zero, and the analytical price is exact.
+        if _is_negligible(bs_price, args):
+            await fetch_risk_free_rate_async()
+            pricing_result = _analytical_result(bs_price)
+        else:
+            _, pricing_result = await asyncio.gather(
+                fetch_risk_free_rate_async(),
+                asyncio.to_thread(
+                    price_european_option, *args, request.num_simulations
+                ),
+            )
+
+        # Steps 5-7: build the record and response
+        result, response = _build_simulation(
+            request, pricing_result, bs_price, greeks
         )
 
-        # Step 4: Calculate Black-Scholes price and Greeks for comparison
-        bs_price = black_scholes_price(
-            spot_price=request.spot_price,
-            strike_price=request.strike_price,
-            time_to_maturity=request.time_to_maturity,
-            volatility=request.volatility,
-            risk_free_rate=request.risk_free_rate,
-            option_type=request.option_type,
-        )
+        # Step 8: Save to JSON (async file I/O)
+        await save_simulation_result(result)
+        return response
 
-        greeks = calculate_greeks(
-            spot_price=request.spot_price,
-            strike_price=request.strike_price,
-            time_to_maturity=request.time_to_maturity,
-            volatility=request.volatility,
-            risk_free_rate=request.risk_free_rate,
-            option_type=request.option_type,
+    except HTTPException:
+        # Re-raise HTTP exceptions (validation errors)
+        raise
+    except Exception as e:
+        # Catch unexpected errors
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Simulation failed: {str(e)}",
         )
 
-        # Step 5: Generate unique ID and timestamp
-        simulation_id = f"sim_{int(time.time())}_{secrets.token_hex(4)}"
-        timestamp = datetime.utcnow()
-
-        # Step 6: Save to JSON (async file I/O)
-        result = SimulationResult(
-            simulation_id=simulation_id,
-            option_price=pricing_result["price"],
-            std_error=pricing_result["std_error"],
-            confidence_interval_95=pricing_result["confidence_interval_95"],
-            black_scholes_price=bs_price,
-            greeks=greeks,
-            inputs=request.model_dump(),
-            timestamp=timestamp,
-        )
 
-        await save_simulation_result(result)
+@app.post(
+    "/simulations/batch",
+    response_model=List[OptionPricingResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_simulation_batch(requests: List[OptionPricingRequest]):
+    """
+    Price a list of options in one Monte Carlo run and store each result.
 
-        # Step 7: Return response
-        return OptionPricingResponse(
-            simulation_id=simulation_id,
-            option_price=pricing_result["price"],
-            std_error=pricing_result["std_error"],
-            confidence_interval_95=pricing_result["confidence_interval_95"],
-            black_scholes_price=bs_price,
-            greeks=greeks,
-            inputs=request,
-            timestamp=timestamp,
+    All options share the same random draws (see price_batch), which is
+    much cheaper than posting them one by one.
+    """
+    if not 1 <= len(requests) <= MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Batch must contain between 1 and {MAX_BATCH_SIZE} options",
         )
 
+    try:
+        await asyncio.gather(*(validate_inputs_async(r) for r in requests))
+
+        args = [_pricing_args(r) for r in requests]
+        analytical = [price_and_greeks(*a) for a in args]
+        pricing_results = [_analytical_result(bs_price) for bs_price, _ in analytical]
+
+        # Only the options that are not deep out of the money are simulated
+        simulated = [
+            i
+            for i, (bs_price, _) in enumerate(analytical)
+            if not _is_negligible(bs_price, args[i])
+        ]
+        if simulated:
+            # One column per pricer argument (structure of arrays); the
+            # market data fetch overlaps the pricing as in create_simulation
+            _, simulated_results = await asyncio.gather(
+                fetch_risk_free_rate_async(),
+                asyncio.to_thread(
+                    price_batch,
+                    *zip(*(args[i] for i in simulated)),
+                    num_simulations=[requests[i].num_simulations for i in simulated],
+                ),
+            )
+            for i, pricing_result in zip(simulated, simulated_results):
+                pricing_results[i] = pricing_result
+        else:
+            await fetch_risk_free_rate_async()
+
+        built = [
+            _build_simulation(request, pricing_result, bs_price, greeks)
+            for request, pricing_result, (bs_price, greeks) in zip(
+                requests, pricing_results, analytical
+            )
+        ]
+
+        # One append for the whole batch
+        await save_simulation_results([result for result, _ in built])
+        return [response for _, response in built]
+
     except HTTPException:
-        # Re-raise HTTP exceptions (validation errors)
         raise
     except Exception as e:
-        # Catch unexpected errors
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Simulation failed: {str(e)}",
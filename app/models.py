@@ -86,9 +86,11 @@ class OptionPricingResponse(BaseModel):
     std_error: float
     confidence_interval_95: float
     black_scholes_price: float | None = None
-    greeks: dict[str, float] | None = None
+    # A greek is null where it is undefined (gamma at zero volatility)
+    greeks: dict[str, float | None] | None = None
     inputs: OptionPricingRequest
     timestamp: datetime
+    warning: str | None = None  # e.g. Monte Carlo skipped for deep OTM
 
     model_config = {
         "json_schema_extra": {
@@ -130,9 +132,11 @@ class SimulationResult(BaseModel):
     std_error: float
     confidence_interval_95: float
     black_scholes_price: float | None = None
-    greeks: dict[str, float] | None = None
+    # NaN greeks are stored as JSON null and read back as None
+    greeks: dict[str, float | None] | None = None
     inputs: dict  # Store the original request as dict
     timestamp: datetime
+    warning: str | None = None
 
 
 class HealthCheckResponse(BaseModel):
@@ -2,109 +2,222 @@
 JSON-based persistence layer.
 
 This demonstrates:
-1. Async file I/O with aiofiles (non-blocking reads/writes)
+1. Non-blocking file I/O (blocking calls run in a worker thread)
 2. Simple CRUD operations
 3. Error handling for file operations
 
+Results are stored as NDJSON (one JSON document per line), so saving a
+result is a single append instead of re-reading and rewriting the whole
+file. The file is mirrored in memory, so reads never touch the disk
+after the first load (this assumes a single process owns the file).
+
 In production, you'd use:
 - PostgreSQL with SQLAlchemy (async mode)
 - Redis for caching
 - MongoDB for document storage
 """
 
-import json
-import aiofiles
+import asyncio
+import logging
+import orjson
+from pathlib import Path
 from typing import List, Optional
 
+from pydantic import ValidationError
+
+from app import config
 from app.models import SimulationResult
-from app.config import RESULTS_FILE
+
+logger = logging.getLogger(__name__)
+
+
+# In-memory mirror of the results file, keyed by simulation_id (in
+# insertion order). Writes update the file and the cache together under
+# _lock. The cache remembers which file it was loaded from, so using
+# another file (the public functions' path argument, or a different
+# config.RESULTS_FILE) triggers a reload.
+# Entries are validated models: each record is validated once, when it is
+# loaded or saved, and reads hand out the cached instance as-is.
+_cache: dict[str, SimulationResult] = {}
+_cache_path: Optional[Path] = None
+_lock = asyncio.Lock()
 
 
-async def _read_results_file() -> List[dict]:
-    """Read the results JSON file."""
-    if not RESULTS_FILE.exists():
-        # Initialize empty file
-        async with aiofiles.open(RESULTS_FILE, "w") as f:
-            await f.write("[]")
+def _resolve(path: Optional[Path]) -> Path:
+    """The results file to use: path, or config.RESULTS_FILE if None."""
+    return config.RESULTS_FILE if path is None else path
+
+
+async def _read_results_file(path: Path) -> List[dict]:
+    """Read all results from the NDJSON file."""
+    if not path.exists():
         return []
 
-    async with aiofiles.open(RESULTS_FILE, "r") as f:
-        content = await f.read()
-        return json.loads(content)
+    # A single thread hop for the whole file; the results are small, so
+    # this beats streaming them through an async file object
+    content = await asyncio.to_thread(path.read_bytes)
 
+    records = (orjson.loads(line) for line in content.splitlines() if line.strip())
+    # Skip anything that is not a result object (e.g. a stray "[]" line)
+    return [r for r in records if isinstance(r, dict)]
 
-async def _write_results_file(results: List[dict]) -> None:
-    """Write results to JSON file."""
-    async with aiofiles.open(RESULTS_FILE, "w") as f:
-        await f.write(json.dumps(results, indent=2, default=str))
 
+async def _import_legacy_results(path: Path) -> None:
+    """
+    Convert the pre-NDJSON results file (a single JSON array, e.g.
+    data/results.json next to data/results.ndjson) into the NDJSON file.
 
-async def save_simulation_result(result: SimulationResult) -> None:
+    Only runs when the NDJSON file does not exist yet; the legacy file is
+    left in place.
+    """
+    legacy_file = path.with_suffix(".json")
+    if legacy_file == path or not legacy_file.exists():
+        return
+
+    content = await asyncio.to_thread(legacy_file.read_bytes)
+
+    results = orjson.loads(content) if content.strip() else []
+    await _write_results_file(path, [r for r in results if isinstance(r, dict)])
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+async def _append_results(path: Path, results: List[dict]) -> None:
+    """Append results as NDJSON lines with a single write."""
+    await asyncio.to_thread(
+        _append_bytes,
+        path,
+        b"".join(orjson.dumps(r) + b"\n" for r in results),
+    )
+
+
+async def _write_results_file(path: Path, results: List[dict]) -> None:
+    """Rewrite the NDJSON file with the given results."""
+    await asyncio.to_thread(
+        path.write_bytes,
+        b"".join(orjson.dumps(r) + b"\n" for r in results),
+    )
+
+
+async def _load_cache(path: Path) -> dict[str, SimulationResult]:
+    """Return the cache of path, loading it from disk if needed. Hold _lock."""
+    global _cache, _cache_path
+
+    if _cache_path != path:
+        if not path.exists():
+            await _import_legacy_results(path)
+        _cache = {}
+        for r in await _read_results_file(path):
+            # One bad record must not make every other result unreadable
+            try:
+                result = SimulationResult(**r)
+            except ValidationError as e:
+                logger.warning("Skipping invalid result in %s: %s", path, e)
+                continue
+            _cache[result.simulation_id] = result
+        _cache_path = path
+
+    return _cache
+
+
+async def save_simulation_result(
+    result: SimulationResult, path: Optional[Path] = None
+) -> None:
     """
     Save a simulation result to JSON.
 
     Args:
         result: The simulation result to save
+        path: Results file (defaults to config.RESULTS_FILE)
 
     Note: In production, consider:
     - Using a database transaction
     - Implementing retry logic
     - Adding file locking for concurrent writes
     """
-    results = await _read_results_file()
+    await save_simulation_results([result], path)
+
+
+async def save_simulation_results(
+    results: List[SimulationResult], path: Optional[Path] = None
+) -> None:
+    """
+    Save several simulation results with one append.
 
-    # Convert Pydantic model to dict
-    result_dict = result.model_dump(mode="json")
+    A batch costs a single file open, write and thread hop instead of one
+    per result.
+    """
+    path = _resolve(path)
+    # Convert Pydantic models to dicts
+    result_dicts = [r.model_dump(mode="json") for r in results]
 
-    # Append new result
-    results.append(result_dict)
+    async with _lock:
+        cache = await _load_cache(path)
 
-    # Write back to file
-    await _write_results_file(results)
+        # Append new results (O(batch), independent of how many are stored)
+        await _append_results(path, result_dicts)
+        for result in results:
+            cache[result.simulation_id] = result
 
 
-async def get_simulation_result(simulation_id: str) -> Optional[SimulationResult]:
+async def get_simulation_result(
+    simulation_id: str, path: Optional[Path] = None
+) -> Optional[SimulationResult]:
     """
     Retrieve a simulation by ID.
 
     Returns:
         SimulationResult if found, None otherwise
     """
-    results = await _read_results_file()
-
-    for result_dict in results:
-        if result_dict["simulation_id"] == simulation_id:
-            # Convert dict back to Pydantic model
-            return SimulationResult(**result_dict)
-
-    return None
+    async with _lock:
+        cache = await _load_cache(_resolve(path))
+        return cache.get(simulation_id)
 
 
-async def get_all_simulation_results() -> List[SimulationResult]:
+async def get_all_simulation_results(
+    path: Optional[Path] = None,
+) -> List[SimulationResult]:
     """
     Retrieve all simulation results.
 
     In production, add pagination to avoid loading huge datasets.
     """
-    results = await _read_results_file()
-    return [SimulationResult(**r) for r in results]
+    async with _lock:
+        cache = await _load_cache(_resolve(path))
+        return list(cache.values())
 
 
-async def delete_simulation_result(simulation_id: str) -> bool:
+async def delete_simulation_result(
+    simulation_id: str, path: Optional[Path] = None
+) -> bool:
     """
     Delete a simulation result.
 
+    Deletes are rare, so they still rewrite the file.
+
     Returns:
         True if deleted, False if not found
     """
-    results = await _read_results_file()
-
-    # Filter out the result to delete
-    new_results = [r for r in results if r["simulation_id"] != simulation_id]
-
-    # If nothing was removed, the ID wasn't found
-    if len(new_results) == len(results):
-        return False
-
-    await _write_results_file(new_results)
-    return True
\ No newline at end of file
+    path = _resolve(path)
+
+    async with _lock:
+        cache = await _load_cache(path)
+
+        # If the ID isn't cached, it isn't stored
+        if simulation_id not in cache:
+            return False
+
+        await _write_results_file(
+            path,
+            [
+                r.model_dump(mode="json")
+                for r in cache.values()
+                if r.simulation_id != simulation_id
+            ],
+        )
+        del cache[simulation_id]
+
+    return True
@@ -146,4 +146,69 @@ def test_delete_simulation(client):
 
     # Verify it's gone
     get_response = client.get(f"/simulations/{simulation_id}")
-    assert get_response.status_code == 404
\ No newline at end of file
+    assert get_response.status_code == 404
+
+
+def test_deep_out_of_the_money_skips_monte_carlo(client):
+    """Test that a negligible Black-Scholes price is returned as-is."""
+    payload = {
+        "spot_price": 100,
+        "strike_price": 1000,
+        "time_to_maturity": 0.1,
+        "volatility": 0.2,
+        "risk_free_rate": 0.05,
+        "option_type": "call",
+        "num_simulations": 10000,
+    }
+
+    response = client.post("/simulations", json=payload)
+    assert response.status_code == 201
+
+    data = response.json()
+    assert data["option_price"] == data["black_scholes_price"]
+    assert data["std_error"] == 0
+    assert data["warning"] is not None
+
+
+def test_create_simulation_batch(client):
+    """Test pricing several options in one request."""
+    payload = [
+        {
+            "spot_price": 100,
+            "strike_price": 105,
+            "time_to_maturity": 1.0,
+            "volatility": 0.2,
+            "risk_free_rate": 0.05,
+            "option_type": "call",
+            "num_simulations": 10000,
+        },
+        {
+            "spot_price": 100,
+            "strike_price": 95,
+            "time_to_maturity": 0.5,
+            "volatility": 0.3,
+            "risk_free_rate": 0.05,
+            "option_type": "put",
+            "num_simulations": 20000,
+        },
+    ]
+
+    response = client.post("/simulations/batch", json=payload)
+    assert response.status_code == 201
+
+    data = response.json()
+    assert len(data) == 2
+    assert data[0]["inputs"]["option_type"] == "call"
+    assert data[1]["inputs"]["option_type"] == "put"
+    assert all(d["option_price"] > 0 for d in data)
+
+    # Each priced option is stored individually
+    for d in data:
+        get_response = client.get(f"/simulations/{d['simulation_id']}")
+        assert get_response.status_code == 200
+
+
+def test_create_simulation_batch_empty(client):
+    """Test that an empty batch is rejected."""
+    response = client.post("/simulations/batch", json=[])
+    assert response.status_code == 422
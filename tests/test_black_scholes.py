@@ -0,0 +1,61 @@
+"""Unit tests for the Black-Scholes closed-form pricer."""
+
+import math
+
+import pytest
+from app.black_scholes import black_scholes_price, calculate_greeks, price_and_greeks
+
+
+class TestBlackScholesPrice:
+    """Test suite for analytical prices."""
+
+    def test_reference_call_and_put(self):
+        """ATM reference values from the textbook example."""
+        call = black_scholes_price(100, 100, 1.0, 0.2, 0.05, "call")
+        put = black_scholes_price(100, 100, 1.0, 0.2, 0.05, "put")
+
+        assert call == pytest.approx(10.450583572185565, rel=1e-12)
+        assert put == pytest.approx(5.573526022256971, rel=1e-12)
+
+    def test_put_call_parity(self):
+        """C - P = S - K*e^(-rT)."""
+        call = black_scholes_price(110, 95, 0.5, 0.3, 0.02, "call")
+        put = black_scholes_price(110, 95, 0.5, 0.3, 0.02, "put")
+
+        assert call - put == pytest.approx(110 - 95 * math.exp(-0.02 * 0.5))
+
+    def test_zero_volatility(self):
+        """Zero volatility collapses to the discounted forward payoff."""
+        price = black_scholes_price(100, 105, 1.0, 0.0, 0.05, "call")
+        assert price == pytest.approx(100 - 105 * math.exp(-0.05))
+
+
+class TestGreeks:
+    """Test suite for Greeks."""
+
+    def test_reference_call_greeks(self):
+        """ATM call Greeks."""
+        greeks = calculate_greeks(100, 100, 1.0, 0.2, 0.05, "call")
+
+        assert greeks["delta"] == pytest.approx(0.6368306511756191)
+        assert greeks["gamma"] == pytest.approx(0.018762017345846895)
+        assert greeks["vega"] == pytest.approx(0.3752403469169379)
+        assert greeks["theta"] == pytest.approx(-0.01757267820941972)
+        assert greeks["rho"] == pytest.approx(0.5323248154537634)
+
+    def test_put_delta_is_call_delta_minus_one(self):
+        """Delta parity between calls and puts."""
+        call = calculate_greeks(100, 90, 0.25, 0.4, 0.03, "call")
+        put = calculate_greeks(100, 90, 0.25, 0.4, 0.03, "put")
+
+        assert put["delta"] == pytest.approx(call["delta"] - 1)
+        assert put["gamma"] == pytest.approx(call["gamma"])
+        assert put["vega"] == pytest.approx(call["vega"])
+
+    def test_price_and_greeks_matches_separate_calls(self):
+        """The fused function agrees with the standalone ones."""
+        args = (95, 100, 0.75, 0.25, 0.04, "put")
+        price, greeks = price_and_greeks(*args)
+
+        assert price == black_scholes_price(*args)
+        assert greeks == calculate_greeks(*args)
@@ -0,0 +1,62 @@
+"""Tests for the CUDA Monte Carlo kernel, run on Numba's CUDA simulator."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# The simulator is selected by an environment variable read when Numba is
+# imported, so the comparison runs in a fresh interpreter.
+_SCRIPT = """
+import json
+import sys
+
+import numpy as np
+
+try:
+    from numba import cuda
+
+    usable = cuda.is_available()
+except Exception:
+    usable = False
+if not usable:
+    sys.exit(77)
+
+import app._cuda_kernel as cuda_kernel
+from app._kernels import _mc_kernel
+
+cuda_kernel.BLOCKS = 2  # the simulator runs each GPU thread as a Python thread
+seeds = np.random.SeedSequence(3).generate_state(64)
+results = []
+for args in [
+    (100.0, 100.0, 1.0, 0.2, 0.05, True),
+    (80.0, 100.0, 2.0, 0.3, 0.01, False),
+    (100.0, 100.0, 10.0, 2.5, 0.05, True),  # priced by parity from the put
+]:
+    results.append(
+        [cuda_kernel.mc_cuda(*args, 8_192, seeds), _mc_kernel(*args, 8_192, seeds)]
+    )
+print(json.dumps(results))
+"""
+
+
+def test_cuda_kernel_matches_cpu_kernel():
+    """mc_cuda and _mc_kernel agree within their standard errors."""
+    env = dict(os.environ, NUMBA_ENABLE_CUDASIM="1")
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", _SCRIPT],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode == 77:
+        pytest.skip("Numba CUDA simulator is not usable here")
+    assert proc.returncode == 0, proc.stderr
+
+    for (gpu_mean, gpu_var), (cpu_mean, cpu_var) in json.loads(proc.stdout):
+        assert gpu_var > 0
+        assert abs(gpu_mean - cpu_mean) < 5 * (gpu_var + cpu_var) ** 0.5
@@ -2,14 +2,61 @@
 
 import pytest
 import numpy as np
-from app.monte_carlo import price_european_option, validate_pricing_inputs
+from concurrent.futures import ThreadPoolExecutor
+from scipy.stats import qmc, t as student_t
+from app.black_scholes import black_scholes_price
+from app.monte_carlo import price_batch, price_european_option, validate_pricing_inputs
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pricing():
+    """
+    Price once before any test so one-off costs (kernel cache load,
+    Numba thread pool start-up, SciPy's Sobol tables) are not charged to
+    whichever test happens to run first.
+    """
+    price_european_option(100, 100, 1.0, 0.2, 0.05, "call", 1_000, 42)
 
 
 class TestOptionPricing:
     """Test suite for option pricing calculations."""
 
-    def test_call_option_pricing(self):
-        """Test that call option pricing produces reasonable results."""
+    @pytest.mark.parametrize(
+        "spot, strike, maturity, option_type, low, high",
+        [
+            # At-the-money call with reasonable parameters should be priced
+            # around 10 (Black-Scholes reference: ~10.45)
+            pytest.param(100, 100, 1.0, "call", 9.0, 12.0, id="atm_call"),
+            # At-the-money put is cheaper than the call (positive drift)
+            pytest.param(100, 100, 1.0, "put", 5.0, 8.0, id="atm_put"),
+            # Deep ITM call is close to its intrinsic value of 50
+            pytest.param(150, 100, 0.1, "call", 49.0, np.inf, id="deep_itm_call"),
+            # Deep OTM put is nearly worthless
+            pytest.param(150, 100, 0.1, "put", -np.inf, 0.1, id="deep_otm_put"),
+        ],
+    )
+    def test_european_price(self, spot, strike, maturity, option_type, low, high):
+        """Prices land in the expected range for typical moneyness."""
+        result = price_european_option(
+            spot_price=spot,
+            strike_price=strike,
+            time_to_maturity=maturity,
+            volatility=0.2,
+            risk_free_rate=0.05,
+            option_type=option_type,
+            num_simulations=10_000,
+            random_seed=42,  # For reproducibility
+        )
+
+        assert low < result["price"] < high
+        assert result["std_error"] >= 0
+        # Default QMC runs use the t quantile for 16 replicates
+        assert result["confidence_interval_95"] == pytest.approx(
+            student_t.ppf(0.975, 15) * result["std_error"]
+        )
+
+    def test_variance_reduction_matches_black_scholes(self):
+        """Antithetic + control variates land within a few std errors of BS."""
         result = price_european_option(
             spot_price=100,
             strike_price=100,
@@ -18,62 +65,194 @@ class TestOptionPricing:
             risk_free_rate=0.05,
             option_type="call",
             num_simulations=100_000,
-            random_seed=42,  # For reproducibility
+            random_seed=42,
         )
 
-        # At-the-money call with reasonable parameters should be priced around 10
-        # (Using Black-Scholes as a reference, this should be ~10.45)
-        assert 9.0 < result["price"] < 12.0
-        assert result["std_error"] > 0
-        assert result["confidence_interval_95"] > 0
+        # Plain Monte Carlo gives a std error of ~0.047 at this size
+        assert 0 < result["std_error"] < 0.02
+        assert abs(result["price"] - 10.4506) < 4 * result["std_error"]
 
-    def test_put_option_pricing(self):
-        """Test put option pricing."""
-        result = price_european_option(
+    def test_qmc_beats_pseudo_random(self):
+        """Sobol QMC has a much smaller error than pseudo-random draws."""
+        kwargs = dict(
             spot_price=100,
             strike_price=100,
             time_to_maturity=1.0,
             volatility=0.2,
             risk_free_rate=0.05,
-            option_type="put",
+            option_type="call",
             num_simulations=100_000,
             random_seed=42,
         )
+        qmc_result = price_european_option(**kwargs, use_qmc=True)
+        mc_result = price_european_option(**kwargs, use_qmc=False)
+
+        assert qmc_result["std_error"] < mc_result["std_error"] / 5
+        assert abs(qmc_result["price"] - 10.4506) < 0.005
+
+    @pytest.mark.parametrize("use_qmc", [True, False])
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    @pytest.mark.parametrize(
+        "volatility, maturity",
+        [
+            pytest.param(0.5, 1.0, id="sigma_sqrt_t=0.5"),
+            pytest.param(1.0, 1.0, id="sigma_sqrt_t=1"),
+            pytest.param(2.0, 1.0, id="sigma_sqrt_t=2"),
+            pytest.param(2.0, 3.0, id="sigma_sqrt_t=3.5"),
+            pytest.param(2.5, 10.0, id="sigma_sqrt_t=7.9"),
+            pytest.param(5.0, 10.0, id="sigma_sqrt_t=15.8"),
+        ],
+    )
+    def test_matches_black_scholes_across_sigma_sqrt_t(
+        self, volatility, maturity, option_type, use_qmc
+    ):
+        """
+        Prices stay within a few standard errors of Black-Scholes up to the
+        largest σ√T the API accepts, where S_T is too heavy-tailed for an
+        estimated control variate.
+        """
+        args = (100, 100, maturity, volatility, 0.05, option_type)
+        result = price_european_option(
+            *args, num_simulations=100_000, random_seed=42, use_qmc=use_qmc
+        )
+
+        error = abs(result["price"] - black_scholes_price(*args))
+        assert error <= 4 * result["std_error"] + 1e-9
+
+    def test_qmc_standard_error_is_calibrated(self):
+        """
+        QMC errors average out to ~0 standard errors across seeds just below
+        the control variate cutoff, where a per-replicate β was biased.
+        """
+        args = (100, 100, 1.0, 1.5, 0.05, "call")
+        reference = black_scholes_price(*args)
+        z_scores = [
+            (result["price"] - reference) / result["std_error"]
+            for result in (
+                price_european_option(*args, num_simulations=100_000, random_seed=s)
+                for s in range(20)
+            )
+        ]
+
+        # The mean of 20 z-scores has a standard deviation of ~0.25
+        assert abs(np.mean(z_scores)) < 0.75
+
+    @pytest.mark.parametrize("use_qmc", [True, False])
+    def test_moments_do_not_cancel_far_from_the_forward(self, use_qmc):
+        """
+        At σ√T ≈ 16 nearly every S_T is ~0, far below the forward of ~2000;
+        the variance sums must not cancel into a wrong price.
+        """
+        args = (100, 100, 10.0, 5.0, 0.3, "put")
+        result = price_european_option(
+            *args, num_simulations=200_000, random_seed=3, use_qmc=use_qmc
+        )
 
-        # At-the-money put should be cheaper than call (due to positive drift)
-        assert 5.0 < result["price"] < 8.0
+        assert result["price"] == pytest.approx(black_scholes_price(*args), rel=1e-3)
 
-    def test_deep_in_the_money_call(self):
-        """Deep ITM call should approximately equal intrinsic value."""
+    def test_qmc_boundary_points_stay_finite(self, monkeypatch):
+        """A Sobol point of exactly 0.0 does not produce a NaN price."""
+        monkeypatch.setattr(
+            qmc.Sobol, "random_base2", lambda self, m: np.zeros((2**m, 1))
+        )
         result = price_european_option(
-            spot_price=150,
+            spot_price=100,
             strike_price=100,
-            time_to_maturity=0.1,  # Short time to expiry
+            time_to_maturity=1.0,
             volatility=0.2,
             risk_free_rate=0.05,
-            option_type="call",
-            num_simulations=50_000,
+            option_type="put",
+            num_simulations=1_000,
             random_seed=42,
         )
 
-        # Intrinsic value is 50, so price should be close to that
-        assert result["price"] > 49.0
+        assert np.isfinite(result["price"])
+        assert np.isfinite(result["std_error"])
 
-    def test_out_of_the_money_put(self):
-        """Deep OTM put should be nearly worthless."""
-        result = price_european_option(
-            spot_price=150,
+    def test_seeded_runs_are_reproducible(self):
+        """The same seed gives the same estimate."""
+        kwargs = dict(
+            spot_price=100,
+            strike_price=100,
+            time_to_maturity=1.0,
+            volatility=0.2,
+            risk_free_rate=0.05,
+            option_type="call",
+            num_simulations=10_000,
+        )
+        first = price_european_option(**kwargs, random_seed=7)
+        second = price_european_option(**kwargs, random_seed=7)
+        unseeded = price_european_option(**kwargs)
+
+        assert first == second
+        assert unseeded["price"] != first["price"]
+
+    def test_out_of_range_seed_is_rejected(self):
+        """Seeds outside uint32 raise instead of wrapping around."""
+        kwargs = dict(
+            spot_price=100,
             strike_price=100,
-            time_to_maturity=0.1,
+            time_to_maturity=1.0,
             volatility=0.2,
             risk_free_rate=0.05,
-            option_type="put",
-            num_simulations=50_000,
+            option_type="call",
+            num_simulations=1_000,
+        )
+        with pytest.raises(ValueError):
+            price_european_option(**kwargs, random_seed=-1)
+        with pytest.raises(ValueError):
+            price_european_option(**kwargs, random_seed=2**32)
+
+    def test_concurrent_pricing_from_threads(self):
+        """Pricing from several worker threads matches sequential runs."""
+        kwargs = dict(
+            spot_price=100,
+            strike_price=100,
+            time_to_maturity=1.0,
+            volatility=0.2,
+            risk_free_rate=0.05,
+            option_type="call",
+            num_simulations=20_000,
+            use_qmc=False,
+        )
+        expected = [price_european_option(**kwargs, random_seed=s) for s in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(
+                    lambda s: price_european_option(**kwargs, random_seed=s), range(8)
+                )
+            )
+
+        assert results == expected
+
+    def test_batch_matches_single_option_pricing(self):
+        """Each option in a batch is priced like a standalone call."""
+        results = price_batch(
+            spot_prices=[100, 150],
+            strike_prices=[100, 100],
+            times_to_maturity=[1.0, 0.1],
+            volatilities=[0.2, 0.2],
+            risk_free_rates=[0.05, 0.05],
+            option_types=["call", "put"],
+            num_simulations=[100_000, 50_000],
             random_seed=42,
         )
+        single = price_european_option(
+            spot_price=100,
+            strike_price=100,
+            time_to_maturity=1.0,
+            volatility=0.2,
+            risk_free_rate=0.05,
+            option_type="call",
+            num_simulations=100_000,
+            random_seed=42,
+            use_qmc=False,  # batches share pseudo-random draws
+        )
 
-        # Should be very close to zero
-        assert result["price"] < 0.1
+        assert len(results) == 2
+        assert results[0]["price"] == pytest.approx(single["price"])
+        assert results[1]["price"] < 0.1
 
 
 class TestInputValidation:
@@ -124,4 +303,56 @@ class TestInputValidation:
             risk_free_rate=0.05,
         )
         assert is_valid
-        assert msg == ""
\ No newline at end of file
+        assert msg == ""
+
+    @pytest.mark.parametrize(
+        "field",
+        [
+            "spot_price",
+            "strike_price",
+            "time_to_maturity",
+            "volatility",
+            "risk_free_rate",
+        ],
+    )
+    def test_nan_input(self, field):
+        """NaN fails every rule instead of slipping past the comparisons."""
+        inputs = dict(
+            spot_price=100,
+            strike_price=105,
+            time_to_maturity=1.0,
+            volatility=0.25,
+            risk_free_rate=0.05,
+        )
+        inputs[field] = float("nan")
+
+        is_valid, msg = validate_pricing_inputs(**inputs)
+        assert not is_valid
+        assert msg
+
+    def test_volatility_upper_bound_is_inclusive(self):
+        """Exactly 500% volatility is still accepted."""
+        is_valid, msg = validate_pricing_inputs(
+            spot_price=100,
+            strike_price=105,
+            time_to_maturity=1.0,
+            volatility=5.0,
+            risk_free_rate=0.05,
+        )
+        assert is_valid
+        assert msg == ""
+
+    @pytest.mark.parametrize(
+        "rate, expected",
+        [(-0.1, True), (0.3, True), (-0.1001, False), (0.3001, False)],
+    )
+    def test_risk_free_rate_bounds(self, rate, expected):
+        """The -10% and 30% rate bounds are inclusive."""
+        is_valid, _ = validate_pricing_inputs(
+            spot_price=100,
+            strike_price=105,
+            time_to_maturity=1.0,
+            volatility=0.25,
+            risk_free_rate=rate,
+        )
+        assert is_valid is expected
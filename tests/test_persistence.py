@@ -4,32 +4,34 @@ import pytest
 from datetime import datetime
 from pathlib import Path
 
+from app.black_scholes import price_and_greeks
 from app.models import SimulationResult
 from app.persistence import (
     save_simulation_result,
+    save_simulation_results,
     get_simulation_result,
     get_all_simulation_results,
     delete_simulation_result,
 )
-import app.config as config
 
+# Every test here is async; run them all on one session-wide event loop
+# instead of creating and closing a loop per test
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-def temp_results_file(tmp_path):
-    """Create a temporary results file for testing."""
-    temp_file = tmp_path / "test_results.json"
-    original_file = config.RESULTS_FILE
+# Fixed timestamp: deterministic records, and no clock read per result
+_T0 = datetime(2024, 1, 1)
 
-    # Override the config
-    config.RESULTS_FILE = temp_file
 
-    yield temp_file
+@pytest.fixture
+def temp_results_file(tmp_path):
+    """
+    Per-test results file, passed to the persistence functions as path.
 
-    # Restore original
-    config.RESULTS_FILE = original_file
+    Nothing global is modified, so tests can run in parallel (pytest-xdist).
+    """
+    return tmp_path / "test_results.json"
 
 
-@pytest.mark.asyncio
 async def test_save_and_retrieve_result(temp_results_file):
     """Test saving and retrieving a simulation result."""
     result = SimulationResult(
@@ -38,28 +40,26 @@ async def test_save_and_retrieve_result(temp_results_file):
         std_error=0.05,
         confidence_interval_95=0.1,
         inputs={"spot_price": 100, "strike_price": 105},
-        timestamp=datetime.utcnow(),
+        timestamp=_T0,
     )
 
     # Save
-    await save_simulation_result(result)
+    await save_simulation_result(result, path=temp_results_file)
 
     # Retrieve
-    retrieved = await get_simulation_result("test_123")
+    retrieved = await get_simulation_result("test_123", path=temp_results_file)
 
     assert retrieved is not None
     assert retrieved.simulation_id == "test_123"
     assert retrieved.option_price == 10.5
 
 
-@pytest.mark.asyncio
 async def test_get_nonexistent_result(temp_results_file):
     """Test retrieving a result that doesn't exist."""
-    result = await get_simulation_result("nonexistent")
+    result = await get_simulation_result("nonexistent", path=temp_results_file)
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_delete_result(temp_results_file):
     """Test deleting a simulation result."""
     result = SimulationResult(
@@ -68,21 +68,20 @@ async def test_delete_result(temp_results_file):
         std_error=0.05,
         confidence_interval_95=0.1,
         inputs={},
-        timestamp=datetime.utcnow(),
+        timestamp=_T0,
     )
 
-    await save_simulation_result(result)
+    await save_simulation_result(result, path=temp_results_file)
 
     # Delete
-    success = await delete_simulation_result("test_delete")
+    success = await delete_simulation_result("test_delete", path=temp_results_file)
     assert success
 
     # Verify it's gone
-    retrieved = await get_simulation_result("test_delete")
+    retrieved = await get_simulation_result("test_delete", path=temp_results_file)
     assert retrieved is None
 
 
-@pytest.mark.asyncio
 async def test_get_all_results(temp_results_file):
     """Test retrieving all results."""
     # Save multiple results
@@ -93,10 +92,136 @@ async def test_get_all_results(temp_results_file):
             std_error=0.05,
             confidence_interval_95=0.1,
             inputs={},
-            timestamp=datetime.utcnow(),
+            timestamp=_T0,
         )
-        await save_simulation_result(result)
+        await save_simulation_result(result, path=temp_results_file)
 
     # Retrieve all
-    all_results = await get_all_simulation_results()
-    assert len(all_results) == 3
\ No newline at end of file
+    all_results = await get_all_simulation_results(path=temp_results_file)
+    assert len(all_results) == 3
+
+
+async def test_results_are_appended_as_lines(temp_results_file):
+    """Each save appends exactly one NDJSON line."""
+    for i in range(2):
+        result = SimulationResult(
+            simulation_id=f"line_{i}",
+            option_price=10.0,
+            std_error=0.05,
+            confidence_interval_95=0.1,
+            inputs={},
+            timestamp=_T0,
+        )
+        await save_simulation_result(result, path=temp_results_file)
+
+    lines = temp_results_file.read_text().splitlines()
+    assert len(lines) == 2
+    assert '"line_1"' in lines[1]
+
+
+async def test_batch_save(temp_results_file):
+    """A batch is appended in one go and every result is retrievable."""
+    results = [
+        SimulationResult(
+            simulation_id=f"batch_{i}",
+            option_price=10.0 + i,
+            std_error=0.05,
+            confidence_interval_95=0.1,
+            inputs={},
+            timestamp=_T0,
+        )
+        for i in range(3)
+    ]
+    await save_simulation_results(results, path=temp_results_file)
+
+    assert len(temp_results_file.read_text().splitlines()) == 3
+    retrieved = await get_simulation_result("batch_2", path=temp_results_file)
+    assert retrieved.option_price == 12.0
+
+
+async def test_reads_are_served_from_cache(temp_results_file):
+    """Once loaded, reads do not go back to the file."""
+    result = SimulationResult(
+        simulation_id="cached",
+        option_price=10.0,
+        std_error=0.05,
+        confidence_interval_95=0.1,
+        inputs={},
+        timestamp=_T0,
+    )
+    await save_simulation_result(result, path=temp_results_file)
+
+    temp_results_file.unlink()
+
+    retrieved = await get_simulation_result("cached", path=temp_results_file)
+    assert retrieved is not None
+    assert retrieved.simulation_id == "cached"
+
+
+async def test_stray_non_object_lines_are_skipped(temp_results_file):
+    """A leftover "[]" line (the old empty-file recipe) is ignored."""
+    temp_results_file.write_text("[]\n")
+
+    assert await get_all_simulation_results(path=temp_results_file) == []
+
+
+async def test_invalid_records_are_skipped(temp_results_file):
+    """A record that fails validation does not hide the others."""
+    valid = SimulationResult(
+        simulation_id="valid",
+        option_price=10.0,
+        std_error=0.05,
+        confidence_interval_95=0.1,
+        inputs={},
+        timestamp=_T0,
+    )
+    temp_results_file.write_text(
+        '{"simulation_id": "broken"}\n' + valid.model_dump_json() + "\n"
+    )
+
+    results = await get_all_simulation_results(path=temp_results_file)
+    assert [r.simulation_id for r in results] == ["valid"]
+
+
+async def test_zero_volatility_result_survives_reload(tmp_path):
+    """The NaN gamma of a zero-volatility price is stored and read back."""
+    results_file = tmp_path / "results.ndjson"
+    _, greeks = price_and_greeks(100, 105, 1.0, 0.0, 0.05, "call")
+    result = SimulationResult(
+        simulation_id="zero_vol",
+        option_price=0.12,
+        std_error=0.0,
+        confidence_interval_95=0.0,
+        greeks=greeks,
+        inputs={"volatility": 0.0},
+        timestamp=_T0,
+    )
+    await save_simulation_result(result, path=results_file)
+
+    # Reading another file drops the cache, so the next read reloads from disk
+    await get_all_simulation_results(path=tmp_path / "other.ndjson")
+    retrieved = await get_simulation_result("zero_vol", path=results_file)
+
+    assert retrieved is not None
+    assert retrieved.greeks["gamma"] is None
+    assert retrieved.greeks["delta"] == greeks["delta"]
+
+
+async def test_legacy_json_array_is_imported(tmp_path):
+    """An old results.json array is converted when no NDJSON file exists."""
+    legacy = SimulationResult(
+        simulation_id="legacy",
+        option_price=10.0,
+        std_error=0.05,
+        confidence_interval_95=0.1,
+        inputs={},
+        timestamp=_T0,
+    )
+    (tmp_path / "results.json").write_text(
+        "[" + legacy.model_dump_json() + "]"
+    )
+    results_file = tmp_path / "results.ndjson"
+
+    retrieved = await get_simulation_result("legacy", path=results_file)
+    assert retrieved is not None
+    assert len(results_file.read_text().splitlines()) == 1